@@ -2,27 +2,142 @@
 """Command-line tool to scan a folder and generate a summary report."""
 
 import argparse
+import array
+import math
 import os
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 
 
-def scan_folder(folder_path, filter_exts=None):
-    """Scan all files in the folder and collect stats."""
-    file_sizes = []
-    extensions = Counter()
+@dataclass(frozen=True, slots=True)
+class ScanResult:
+    """Stats collected by a folder scan.
+
+    folders holds the absolute path of every folder scanned. names, roots and
+    sizes are parallel: names[i] is a bare file name (no directory part),
+    roots[i] is the absolute path of the folder it was found in, and sizes[i]
+    is its size in bytes. All three are None for a count-only scan. The
+    largest file is tracked the same way, as a bare name plus its folder; it
+    is ("N/A", "", 0) when no file was sized.
+    """
+
+    folders: tuple[str, ...]
+    names: list[str] | None
+    roots: list[str] | None
+    sizes: array.array | None
+    extensions: Counter
+    largest_name: str = "N/A"
+    largest_root: str = ""
+    largest_size: int = 0
+
+
+def scan_folder(folder_path, filter_exts=None, count_only=False):
+    """Scan all files in the folder and collect stats into a ScanResult.
+
+    Sizes are kept in a signed 64-bit array alongside the list of names.
+    With count_only, no file is stat()ed and only the extension counts are
+    collected.
+    """
+    root = os.path.abspath(folder_path)
+    names = roots = sizes = None
+    if not count_only:
+        names = []
+        sizes = array.array("q")
+    # Extensions are few, so each one is interned to a slot in a plain list
+    # of counts; the Counter is only built once the scan is done.
+    ext_index = {}
+    counts = []
+    largest_name, largest_size = "N/A", -1
+    # Raw-case suffix -> lowercased extension, so each distinct suffix is
+    # lowercased only once.
+    lower_cache = {}
 
     for entry in os.scandir(folder_path):
         if entry.is_file(follow_symlinks=False):
-            ext = os.path.splitext(entry.name)[1].lower() or "(no extension)"
+            # Inlined equivalent of splitext(): dots only separate an
+            # extension when something other than dots precedes them, so
+            # ".bashrc", "..foo" and "..." have none.
+            name = entry.name
+            dot = name.rfind(".")
+            if dot > 0 and (name[0] != "." or name[:dot].lstrip(".")):
+                raw_ext = name[dot:]
+            else:
+                raw_ext = "(no extension)"
+            ext = lower_cache.get(raw_ext)
+            if ext is None:
+                ext = lower_cache[raw_ext] = raw_ext.lower()
             if filter_exts and ext not in filter_exts:
                 continue
-            size = entry.stat().st_size
-            file_sizes.append((entry.name, size))
-            extensions[ext] += 1
+            idx = ext_index.get(ext)
+            if idx is None:
+                idx = ext_index[ext] = len(counts)
+                counts.append(0)
+            counts[idx] += 1
+            if count_only:
+                continue
+            # Extension filter runs first so rejected entries never hit stat();
+            # the DirEntry caches the lstat result for any later lookups.
+            size = entry.stat(follow_symlinks=False).st_size
+            names.append(name)
+            sizes.append(size)
+            if size > largest_size:
+                largest_name, largest_size = name, size
+
+    if not count_only:
+        roots = [root] * len(names)
+    largest_root = root if largest_size >= 0 else ""
+    extensions = Counter(dict(zip(ext_index, counts)))
+    return ScanResult(
+        (root,), names, roots, sizes, extensions, largest_name, largest_root, max(largest_size, 0)
+    )
+
+
+def scan_folders(folder_paths, filter_exts=None, count_only=False):
+    """Scan several folders concurrently and merge their stats.
+
+    os.scandir() and stat() release the GIL, so a small thread pool keeps
+    several directory reads in flight. Results are merged in the order the
+    folders were given; roots records which folder each file came from.
+    Callers should pass each directory only once.
+    """
+    if len(folder_paths) == 1:
+        return scan_folder(folder_paths[0], filter_exts, count_only)
+
+    workers = min(32, (os.cpu_count() or 1) * 4, len(folder_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda path: scan_folder(path, filter_exts, count_only), folder_paths))
+
+    # ScanResult is frozen, so merge into fresh containers rather than
+    # extending the first result's.
+    names = roots = sizes = None
+    if not count_only:
+        names = []
+        roots = []
+        sizes = array.array("q")
+    extensions = Counter()
+    # -1 marks "nothing sized yet" so a zero-byte file still wins. Roots with
+    # no sized files report ("N/A", "", 0) and must not take part.
+    largest_name, largest_root, largest_size = "N/A", "", -1
+    for result in results:
+        if not count_only:
+            names.extend(result.names)
+            roots.extend(result.roots)
+            sizes.extend(result.sizes)
+        extensions.update(result.extensions)
+        if result.sizes and result.largest_size > largest_size:
+            largest_name, largest_root = result.largest_name, result.largest_root
+            largest_size = result.largest_size
 
-    return file_sizes, extensions
+    folders = tuple(folder for result in results for folder in result.folders)
+    return ScanResult(
+        folders, names, roots, sizes, extensions, largest_name, largest_root, max(largest_size, 0)
+    )
+
+
+SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB")
 
 
 def format_size(size_bytes: int | float) -> str:
@@ -52,73 +167,108 @@ def format_size(size_bytes: int | float) -> str:
     if size_bytes < 0:
         raise ValueError(f"size_bytes must be non-negative, got {size_bytes}")
 
-    UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB")
-
-    for unit in UNITS:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-
-    # If we exhaust all units, fall back to the largest one
-    return f"{size_bytes:.2f} {UNITS[-1]}"
-
-
-def build_report(folder_path, file_sizes, extensions, filter_exts=None):
-    """Build the summary report as a string."""
-    total_files = len(file_sizes)
-    total_size = sum(size for _, size in file_sizes)
-    largest_name, largest_size = max(file_sizes, key=lambda x: x[1]) if file_sizes else ("N/A", 0)
-
-    lines = [
-        f"Folder Scan Report",
-        f"==================",
-        f"Scanned folder : {os.path.abspath(folder_path)}",
-        f"Date           : {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"Filter         : {', '.join(sorted(filter_exts)) if filter_exts else 'None (all files)'}",
-        f"",
-        f"Total files    : {total_files}",
-        f"Total size     : {format_size(total_size)}",
-        f"Largest file   : {largest_name} ({format_size(largest_size)})",
-        f"",
-        f"File Types Breakdown",
-        f"--------------------",
-    ]
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} {SIZE_UNITS[0]}"
 
-    for ext, count in extensions.most_common():
-        lines.append(f"  {ext:<20} {count} file(s)")
+    # inf and nan have no bit length; keep them in the largest unit.
+    if not math.isfinite(size_bytes):
+        return f"{size_bytes:.2f} {SIZE_UNITS[-1]}"
+
+    # Each unit is 2**10 times the previous one, so the unit index is
+    # floor(log2(size) / 10); sizes past EiB stay in EiB.
+    unit_idx = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_idx)):.2f} {SIZE_UNITS[unit_idx]}"
+
+
+REPORT_HEADER = "Folder Scan Report\n==================\n"
+NOT_COMPUTED_SIZES = "Total size     : (not computed)\nLargest file   : (not computed)\n"
+BREAKDOWN_HEADER = "\nFile Types Breakdown\n--------------------\n"
 
-    return "\n".join(lines)
+
+def build_report(scanned_path, timestamp, result, filter_exts=None):
+    """Yield the summary report as chunks of text.
+
+    scanned_path and timestamp are preformatted by the caller, so the same
+    values can be reused across several reports. Every yielded chunk ends
+    with a newline and can be written out as-is. When result.sizes is
+    None (count-only scan) the size lines say "(not computed)".
+    """
+    extensions = result.extensions
+    total_files = sum(extensions.values())
+
+    yield REPORT_HEADER
+    yield (
+        f"Scanned folder : {scanned_path}\n"
+        f"Date           : {timestamp}\n"
+        f"Filter         : {', '.join(sorted(filter_exts)) if filter_exts else 'None (all files)'}\n"
+        f"\n"
+        f"Total files    : {total_files}\n"
+    )
+
+    if result.sizes is not None:
+        # With several folders a bare name would not say which one it is in.
+        largest_name = result.largest_name
+        if len(result.folders) > 1 and result.largest_root:
+            largest_name = os.path.join(result.largest_root, largest_name)
+        yield (
+            f"Total size     : {format_size(sum(result.sizes))}\n"
+            f"Largest file   : {largest_name} ({format_size(result.largest_size)})\n"
+        )
+    else:
+        yield NOT_COMPUTED_SIZES
+
+    yield BREAKDOWN_HEADER
+    for ext, count in extensions.most_common():
+        yield f"  {ext:<20} {count} file(s)\n"
 
 
 def main():
     parser = argparse.ArgumentParser(description="Scan a folder and generate a summary report.")
-    parser.add_argument("folder", help="Path to the folder to scan")
+    parser.add_argument("folders", nargs="+", metavar="folder", help="Path(s) to the folder(s) to scan")
     parser.add_argument("-o", "--output", default="folder_report.txt", help="Output report file (default: folder_report.txt)")
     parser.add_argument("-e", "--ext", nargs="+", help="Filter by file extension(s), e.g. -e .py .txt")
+    parser.add_argument("-c", "--count-only", action="store_true", help="Only count files by type; skip per-file stat() calls and size totals")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only write the report file; do not echo the report to stdout")
     args = parser.parse_args()
 
-    if not os.path.isdir(args.folder):
-        print(f"Error: '{args.folder}' is not a valid directory.", file=sys.stderr)
-        sys.exit(1)
-
+    # The same directory given twice (or through a symlink) would otherwise
+    # be scanned and counted twice.
+    folders = []
+    seen = set()
+    for folder in args.folders:
+        if not os.path.isdir(folder):
+            print(f"Error: '{folder}' is not a valid directory.", file=sys.stderr)
+            sys.exit(1)
+        real_path = os.path.realpath(folder)
+        if real_path not in seen:
+            seen.add(real_path)
+            folders.append(folder)
+
+    # Scanned extensions are lowercased, so the filter must be too.
     filter_exts = None
     if args.ext:
-        filter_exts = {e if e.startswith(".") else f".{e}" for e in args.ext}
+        filter_exts = frozenset((e if e.startswith(".") else f".{e}").lower() for e in args.ext)
 
-    file_sizes, extensions = scan_folder(args.folder, filter_exts)
+    result = scan_folders(folders, filter_exts, args.count_only)
 
-    if not file_sizes:
-        print(f"No files found in '{args.folder}'.")
+    if not result.extensions:
+        print(f"No files found in {', '.join(repr(folder) for folder in folders)}.")
         sys.exit(0)
 
-    report = build_report(args.folder, file_sizes, extensions, filter_exts)
+    scanned_path = ", ".join(result.folders)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    report = list(build_report(scanned_path, timestamp, result, filter_exts))
 
-    print(report)
+    # The file is written in full before anything goes to stdout, so a
+    # failing stdout (e.g. a closed pipe) cannot leave it half-written.
+    with open(args.output, "w", errors="surrogateescape") as f:
+        f.writelines(report)
 
-    with open(args.output, "w") as f:
-        f.write(report + "\n")
+    if not args.quiet:
+        sys.stdout.writelines(report)
+        print()
 
-    print(f"\nReport saved to: {os.path.abspath(args.output)}")
+    print(f"Report saved to: {os.path.abspath(args.output)}")
 
 
 if __name__ == "__main__":
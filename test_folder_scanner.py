@@ -0,0 +1,144 @@
+import io
+import math
+import os
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from contextlib import redirect_stdout
+from unittest import mock
+
+from folder_scanner import format_size, main, scan_folder, scan_folders
+
+
+def make_files(folder, files):
+    for file_name, data in files:
+        with open(os.path.join(folder, file_name), "wb") as f:
+            f.write(data)
+
+
+class ScanFolderTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+
+    def test_extensions_match_splitext(self):
+        file_names = [".bashrc", "..foo", "...", "x.", "a.PY", "b.tar.gz", "README"]
+        make_files(self.root, [(name, b"") for name in file_names])
+
+        result = scan_folder(self.root)
+
+        expected = Counter(os.path.splitext(name)[1].lower() or "(no extension)" for name in file_names)
+        self.assertEqual(result.extensions, expected)
+
+
+class ScanFoldersTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+
+    def make_folder(self, name, files=()):
+        path = os.path.join(self.root, name)
+        os.mkdir(path)
+        make_files(path, files)
+        return path
+
+    def test_largest_file_after_empty_root(self):
+        empty = self.make_folder("c")
+        zero_byte = self.make_folder("b", [("empty.txt", b"")])
+
+        result = scan_folders([empty, zero_byte])
+
+        self.assertEqual(sum(result.extensions.values()), 1)
+        self.assertEqual((result.largest_root, result.largest_name), (zero_byte, "empty.txt"))
+        self.assertEqual(result.largest_size, 0)
+
+    def test_largest_file_across_roots(self):
+        small = self.make_folder("a", [("small.txt", b"1")])
+        big = self.make_folder("b", [("big.txt", b"12345")])
+
+        result = scan_folders([small, big])
+
+        self.assertEqual((result.largest_root, result.largest_name), (big, "big.txt"))
+        self.assertEqual(result.largest_size, 5)
+        self.assertEqual(sum(result.sizes), 6)
+
+    def test_merged_names_are_bare_with_absolute_roots(self):
+        self.make_folder("a", [("one.txt", b"1")])
+        self.make_folder("b", [("two.txt", b"22")])
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        self.addCleanup(os.chdir, cwd)
+        first, second = os.path.abspath("a"), os.path.abspath("b")
+
+        result = scan_folders(["a", "b"])
+
+        self.assertEqual(result.folders, (first, second))
+        self.assertEqual(result.names, ["one.txt", "two.txt"])
+        self.assertEqual(result.roots, [first, second])
+        self.assertEqual((result.largest_root, result.largest_name), (second, "two.txt"))
+
+    def test_no_sized_files(self):
+        first = self.make_folder("a")
+        second = self.make_folder("b")
+
+        result = scan_folders([first, second])
+
+        self.assertEqual((result.largest_name, result.largest_root, result.largest_size), ("N/A", "", 0))
+
+
+class FormatSizeTest(unittest.TestCase):
+    def test_largest_unit(self):
+        self.assertEqual(format_size(1 << 60), "1.00 EiB")
+        self.assertEqual(format_size(1 << 70), "1024.00 EiB")
+        self.assertEqual(format_size(1 << 80), "1048576.00 EiB")
+
+    def test_non_finite(self):
+        self.assertEqual(format_size(math.inf), "inf EiB")
+        self.assertEqual(format_size(math.nan), "nan EiB")
+
+    def test_negative(self):
+        with self.assertRaises(ValueError):
+            format_size(-1)
+
+
+class MainTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.folder = os.path.join(tmp.name, "scan")
+        os.mkdir(self.folder)
+        make_files(self.folder, [("a.py", b"12"), ("b.PY", b"1234"), ("c.txt", b"1")])
+        self.output = os.path.join(tmp.name, "report.txt")
+
+    def run_main(self, *args):
+        stdout = io.StringIO()
+        argv = ["folder_scanner.py", self.folder, "-o", self.output, *args]
+        with mock.patch.object(sys, "argv", argv), redirect_stdout(stdout):
+            main()
+        with open(self.output) as f:
+            report = f.read()
+        self.assertIn(report, stdout.getvalue())
+        return report
+
+    def test_ext_filter_ignores_case(self):
+        report = self.run_main("-e", ".PY")
+
+        self.assertIn("Filter         : .py\n", report)
+        self.assertIn("Total files    : 2\n", report)
+        self.assertIn("Largest file   : b.PY (4.00 B)\n", report)
+        self.assertNotIn(".txt", report)
+
+    def test_count_only(self):
+        report = self.run_main("--count-only")
+
+        self.assertIn("Total files    : 3\n", report)
+        self.assertIn("Total size     : (not computed)\n", report)
+        self.assertIn("Largest file   : (not computed)\n", report)
+        self.assertIn("  .py                  2 file(s)\n", report)
+
+
+if __name__ == "__main__":
+    unittest.main()